@@ -2,13 +2,24 @@ use crate::args::input::Input;
 use crate::enums::DetailField;
 use crate::exc::Exc;
 use crate::models::{Node, OwnerMan};
-use crate::traits::Imp;
+use crate::traits::{Imp, LOCAL_OFFSET};
 use crate::PLS;
 use log::debug;
 use std::collections::hash_map::Entry;
 use std::collections::HashMap;
 use std::fs::DirEntry;
+use std::num::NonZeroUsize;
 use std::os::unix::ffi::OsStrExt;
+use std::panic;
+use std::sync::LazyLock;
+use std::thread;
+
+/// the minimum number of children each worker thread must convert, because
+/// for fewer entries spawning the thread would cost more than it saves
+const PARALLEL_MIN_ENTRIES: usize = 32;
+
+/// the maximum number of worker threads used to convert children
+const PARALLEL_MAX_WORKERS: usize = 32;
 
 // ======
 // Models
@@ -39,8 +50,8 @@ impl DirGroup {
 
 	/// Convert this directory's children into entries for the output layout.
 	///
-	/// Since nodes can be nested, the function uses the flattened output of
-	/// each node's [`Node::entries`].
+	/// Since nodes can be nested, the function collects the rows that each
+	/// node's [`Node::entries`] writes for itself and its children.
 	pub fn entries(
 		&self,
 		owner_man: &mut OwnerMan,
@@ -51,19 +62,18 @@ impl DirGroup {
 		}
 		Self::re_sort(&mut nodes, owner_man);
 
-		let entries = nodes
-			.iter()
-			.flat_map(|node| {
-				node.entries(
-					owner_man,
-					&self.input.conf,
-					&self.input.conf.app_const,
-					&self.input.conf.entry_const,
-					&[],
-					None,
-				)
-			})
-			.collect();
+		let mut entries = Vec::with_capacity(nodes.len());
+		for node in &nodes {
+			node.entries(
+				&mut entries,
+				owner_man,
+				&self.input.conf,
+				&self.input.conf.app_const,
+				&self.input.conf.entry_const,
+				&[],
+				None,
+			);
+		}
 		Ok(entries)
 	}
 
@@ -82,8 +92,9 @@ impl DirGroup {
 	/// * is above the minimum importance cutoff for visibility
 	///
 	/// If any criteria is not met, the node is not to be rendered and `None` is
-	/// returned.
-	fn node(&self, entry: DirEntry) -> Option<Node> {
+	/// returned. None of these checks need the node's metadata, so it is only
+	/// fetched for nodes that pass all of them.
+	fn node(&self, entry: &DirEntry) -> Option<Node> {
 		let name = entry.file_name();
 		debug!("Checking visibility of name {name:?}.");
 		let haystack = name.as_bytes();
@@ -108,7 +119,7 @@ impl DirGroup {
 			return None;
 		}
 
-		let mut node = Node::new(&entry.path());
+		let mut node = Node::from_entry(entry);
 
 		debug!("Checking visibility of typ {:?}.", node.typ);
 		if !PLS.args.typs.contains(&node.typ) {
@@ -121,6 +132,7 @@ impl DirGroup {
 			return None;
 		}
 
+		node.fetch_meta(entry);
 		Some(node)
 	}
 
@@ -128,13 +140,69 @@ impl DirGroup {
 	///
 	/// Unlike [`FilesGroup`](crate::args::files_group::FilesGroup), this
 	/// function filters out nodes based on visibility.
+	///
+	/// Building a node needs an `lstat(2)` call, which is bound by latency on
+	/// network filesystems and cold caches. For large directories, the entries
+	/// are split into contiguous chunks, one per available core but with at
+	/// least [`PARALLEL_MIN_ENTRIES`] entries each, and converted on scoped
+	/// threads. Chunks are joined in order, so the nodes come back in the same
+	/// order as the directory listing.
 	fn nodes(&self) -> Result<Vec<Node>, Exc> {
-		let entries = self.input.path.read_dir().map_err(Exc::Io)?;
+		let mut entries = self
+			.input
+			.path
+			.read_dir()
+			.map_err(Exc::Io)?
+			.filter_map(Result::ok);
 
-		let entries = entries
-			.filter_map(|entry| entry.ok().and_then(|entry| self.node(entry)))
-			.collect();
-		Ok(entries)
+		let max_workers = thread::available_parallelism()
+			.map_or(1, NonZeroUsize::get)
+			.min(PARALLEL_MAX_WORKERS);
+		if max_workers <= 1 {
+			return Ok(entries.filter_map(|entry| self.node(&entry)).collect());
+		}
+
+		// Read only as far as needed to know if there are enough entries for
+		// at least two workers, so that no more than that is buffered before
+		// small directories are converted on this thread.
+		let mut head: Vec<_> = entries.by_ref().take(2 * PARALLEL_MIN_ENTRIES).collect();
+		if head.len() < 2 * PARALLEL_MIN_ENTRIES {
+			return Ok(head.iter().filter_map(|entry| self.node(entry)).collect());
+		}
+		head.extend(entries);
+		let entries = head;
+
+		// Every worker gets at least `PARALLEL_MIN_ENTRIES` entries.
+		let workers = max_workers.min(entries.len() / PARALLEL_MIN_ENTRIES);
+		debug!("Building {} nodes on {workers} threads.", entries.len());
+
+		// The local offset can only be determined while the process is
+		// single-threaded, so it must be resolved before spawning workers.
+		LazyLock::force(&LOCAL_OFFSET);
+
+		let chunk_size = entries.len().div_ceil(workers);
+		let nodes = thread::scope(|scope| {
+			let handles: Vec<_> = entries
+				.chunks(chunk_size)
+				.map(|chunk| {
+					scope.spawn(move || {
+						chunk
+							.iter()
+							.filter_map(|entry| self.node(entry))
+							.collect::<Vec<_>>()
+					})
+				})
+				.collect();
+			handles
+				.into_iter()
+				.flat_map(|handle| {
+					handle
+						.join()
+						.unwrap_or_else(|err| panic::resume_unwind(err))
+				})
+				.collect()
+		});
+		Ok(nodes)
 	}
 
 	// ======
@@ -151,7 +219,7 @@ impl DirGroup {
 			return;
 		}
 		PLS.args.sort_bases.iter().rev().for_each(|field| {
-			nodes.sort_by(|a, b| field.compare(a, b, owner_man));
+			field.sort(nodes, owner_man);
 		});
 		for node in nodes {
 			Self::re_sort(&mut node.children, owner_man);
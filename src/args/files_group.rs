@@ -37,6 +37,7 @@ impl FilesGroup {
 		let common_ancestor = common_ancestor(&abs);
 		let mut conf = conf_man.get(common_ancestor.as_ref()).unwrap_or_default();
 		conf.app_const.massage_imps();
+		conf.entry_const.massage_timestamps();
 
 		Self {
 			inputs,
@@ -51,6 +51,7 @@ impl Input {
 		let mut conf = conf_man.get(Some(&path))?;
 		debug!("{path:?} {:?}", conf.specs);
 		conf.app_const.massage_imps();
+		conf.entry_const.massage_timestamps();
 
 		Ok(Self {
 			path: path_buf,
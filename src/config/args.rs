@@ -130,16 +130,18 @@ pub struct Args {
 	pub sort_bases: Vec<SortField>,
 }
 
-impl Default for Args {
+impl Args {
 	/// Create a new instance of `Args` parsing real command-line arguments.
-	fn default() -> Self {
+	///
+	/// This consumes the process arguments and exits on `--help`, `--version`
+	/// or invalid input, so it is deliberately not exposed through `Default`
+	/// where it could be triggered implicitly.
+	pub fn from_cli() -> Self {
 		let mut args = Args::parse();
 		args.post_process();
 		args
 	}
-}
 
-impl Args {
 	/// Create a new instance of `Args` parsing the given arguments.
 	#[cfg(test)]
 	pub fn raw<I, T>(itr: I) -> Self
@@ -1,6 +1,8 @@
 use crate::enums::{DetailField, Oct, Sym, SymState, Typ};
+use log::warn;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use time::format_description::{self, OwnedFormatItem};
 
 #[derive(Serialize, Deserialize)]
 pub struct EntryConst {
@@ -26,6 +28,10 @@ pub struct EntryConst {
 	pub blocks_style: String,
 	/// mapping of timestamp fields to the human-readable format
 	pub timestamp_formats: HashMap<DetailField, String>,
+	/// mapping of timestamp fields to the parsed format, derived from
+	/// `timestamp_formats`
+	#[serde(skip)]
+	pub timestamp_items: HashMap<DetailField, OwnedFormatItem>,
 	/// mapping of symlink state to more symlink state info (including style)
 	pub symlink: HashMap<SymState, SymlinkInfo>,
 }
@@ -114,6 +120,7 @@ impl Default for EntryConst {
 				)
 			})
 			.collect(),
+			timestamp_items: HashMap::new(), // set in EntryConst::massage_timestamps
 			symlink: [
 				(SymState::Ok, "󰁔", "magenta", ""), // nf-md-arrow_right
 				(SymState::Broken, "󱞣", "red", "strikethrough"), // nf-md-arrow_down_right
@@ -136,6 +143,29 @@ impl Default for EntryConst {
 	}
 }
 
+impl EntryConst {
+	/// Set `timestamp_items` by parsing the formats in `timestamp_formats`.
+	///
+	/// Parsing a format description is much more expensive than using it, so
+	/// this is done once per config instead of once per rendered timestamp.
+	/// Invalid formats are logged and skipped.
+	pub fn massage_timestamps(&mut self) {
+		self.timestamp_items = self
+			.timestamp_formats
+			.iter()
+			.filter_map(
+				|(field, fmt)| match format_description::parse_owned::<2>(fmt) {
+					Ok(items) => Some((*field, items)),
+					Err(err) => {
+						warn!("Invalid timestamp format {fmt:?}: {err}");
+						None
+					}
+				},
+			)
+			.collect();
+	}
+}
+
 #[derive(Serialize, Deserialize)]
 pub struct NlinkStyles {
 	/// style to use when file has one hard link
@@ -199,3 +229,18 @@ pub struct SymlinkInfo {
 	/// the style to use for the symlink reference
 	pub ref_style: String, // applies to reference only
 }
+
+#[cfg(test)]
+mod tests {
+	use super::EntryConst;
+
+	#[test]
+	fn test_massage_timestamps_parses_default_formats() {
+		let mut entry_const = EntryConst::default();
+		entry_const.massage_timestamps();
+		assert_eq!(
+			entry_const.timestamp_items.len(),
+			entry_const.timestamp_formats.len()
+		);
+	}
+}
@@ -4,8 +4,10 @@ use figment::providers::{Data, Format, Serialized, Yaml};
 use figment::Figment;
 use git2::Repository;
 use log::{debug, info};
+use std::collections::HashMap;
 use std::env;
-use std::path::Path;
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
 
 /// Manages the configuration system of the application. This manager provides
 /// `Conf` instances tailored to each path, while caching the base configuration
@@ -13,6 +15,9 @@ use std::path::Path;
 pub struct ConfMan {
 	/// the base configuration, i.e. the serialized output of [`Conf::default`]
 	pub base: Figment,
+	/// mapping of directories to the root of the Git repository containing
+	/// them, memoised because discovering a repository walks the file system
+	repo_roots: Mutex<HashMap<PathBuf, Option<PathBuf>>>,
 }
 
 impl Default for ConfMan {
@@ -31,7 +36,10 @@ impl Default for ConfMan {
 		}
 
 		info!("Base configuration prepared.");
-		Self { base }
+		Self {
+			base,
+			repo_roots: Mutex::new(HashMap::new()),
+		}
 	}
 }
 
@@ -51,6 +59,26 @@ impl ConfMan {
 		})
 	}
 
+	/// Get the root of the Git repository that contains the given directory.
+	///
+	/// Since multiple inputs often share a directory, the result of the
+	/// discovery is memoised for each directory.
+	///
+	/// # Arguments
+	///
+	/// * `dir` - the directory for which to find the repository root
+	fn repo_root(&self, dir: &Path) -> Option<PathBuf> {
+		let mut repo_roots = self.repo_roots.lock().unwrap();
+		repo_roots
+			.entry(dir.to_path_buf())
+			.or_insert_with(|| {
+				Repository::discover(dir)
+					.ok()
+					.and_then(|repo| repo.workdir().map(Path::to_path_buf))
+			})
+			.clone()
+	}
+
 	/// Collects all the relevant `.pls.yml` config files into a vector.
 	///
 	/// This includes config files from the following locations:
@@ -61,10 +89,11 @@ impl ConfMan {
 	/// # Arguments
 	///
 	/// * `path` - the path to scan for config files
-	fn yaml_contents(path: &Path) -> Vec<Data<Yaml>> {
+	fn yaml_contents(&self, path: &Path) -> Vec<Data<Yaml>> {
 		// the given path, if a directory, or it's parent; Note that symlinks
-		// are treated as files in this situation.
-		let mut curr = if !path.is_symlink() && path.is_dir() {
+		// are treated as files in this situation, so a single `lstat` that
+		// does not follow them answers both questions.
+		let mut curr = if path.symlink_metadata().is_ok_and(|meta| meta.is_dir()) {
 			path.to_path_buf()
 		} else {
 			match path.parent() {
@@ -75,10 +104,7 @@ impl ConfMan {
 
 		let mut paths = vec![curr.clone()];
 
-		let repo_root = Repository::discover(path)
-			.ok()
-			.and_then(|repo| repo.workdir().map(Path::to_path_buf));
-		if let Some(repo_root) = repo_root {
+		if let Some(repo_root) = self.repo_root(&curr) {
 			while curr.pop() {
 				paths.push(curr.clone());
 				if curr == repo_root {
@@ -103,7 +129,7 @@ impl ConfMan {
 		let mut fig = self.base.clone();
 
 		if let Some(path) = path {
-			for file in Self::yaml_contents(path.as_ref()) {
+			for file in self.yaml_contents(path.as_ref()) {
 				fig = fig.admerge(file);
 			}
 		}
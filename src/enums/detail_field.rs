@@ -4,25 +4,35 @@ use crate::utils::vectors::dedup;
 use clap::ValueEnum;
 use serde::{Deserialize, Serialize};
 use std::fmt::Alignment;
-use std::sync::LazyLock;
-
-static STD_FIELDS: LazyLock<Vec<DetailField>> = LazyLock::new(|| {
-	["nlink", "typ", "perm", "user", "group", "size", "mtime"]
-		.into_iter()
-		.filter_map(|item| DetailField::from_str(item, false).ok())
-		.collect()
-});
-static ALL_FIELDS: LazyLock<Vec<DetailField>> = LazyLock::new(|| {
-	DetailField::value_variants()
-		.iter()
-		.copied()
-		.filter(|variant| {
-			variant != &DetailField::None
-				&& variant != &DetailField::Std
-				&& variant != &DetailField::All
-		})
-		.collect()
-});
+
+const STD_FIELDS: [DetailField; 7] = [
+	DetailField::Nlink,
+	DetailField::Typ,
+	DetailField::Perm,
+	DetailField::User,
+	DetailField::Group,
+	DetailField::Size,
+	DetailField::Mtime,
+];
+const ALL_FIELDS: [DetailField; 17] = [
+	DetailField::Dev,
+	DetailField::Ino,
+	DetailField::Nlink,
+	DetailField::Typ,
+	DetailField::Perm,
+	DetailField::Oct,
+	DetailField::User,
+	DetailField::Uid,
+	DetailField::Group,
+	DetailField::Gid,
+	DetailField::Size,
+	DetailField::Blocks,
+	DetailField::Btime,
+	DetailField::Ctime,
+	DetailField::Mtime,
+	DetailField::Atime,
+	DetailField::Git,
+];
 
 /// This enum contains all the metadata about a node that can be provided by a
 /// UNIX-like operating system.
@@ -164,7 +174,22 @@ impl DetailField {
 
 #[cfg(test)]
 mod tests {
-	use super::DetailField;
+	use super::{DetailField, ALL_FIELDS};
+	use clap::ValueEnum;
+
+	#[test]
+	fn test_all_fields_lists_every_field() {
+		let expected: Vec<_> = DetailField::value_variants()
+			.iter()
+			.copied()
+			.filter(|variant| {
+				variant != &DetailField::None
+					&& variant != &DetailField::Std
+					&& variant != &DetailField::All
+			})
+			.collect();
+		assert_eq!(ALL_FIELDS.to_vec(), expected);
+	}
 
 	macro_rules! make_clean_test {
 		( $($name:ident: $input:expr => $expected:expr,)* ) => {
@@ -24,6 +24,17 @@ struct ImageData {
 static IMAGE_DATA: LazyLock<Mutex<HashMap<u32, ImageData>>> =
 	LazyLock::new(|| Mutex::new(HashMap::new()));
 
+static ICON_SIZE: LazyLock<u8> = LazyLock::new(|| {
+	let scale = std::env::var("PLS_ICON_SCALE")
+		.ok()
+		.and_then(|string| string.parse().ok())
+		.unwrap_or(1.0f32)
+		.min(2.0); // We only allocate two cells for an icon.
+
+	(scale * PLS.window.as_ref().unwrap().cell_width() as f32) // Convert to px.
+		.round() as u8
+});
+
 /// This enum contains the two formats of icons supported by `pls`.
 pub enum Icon {
 	/// a Nerd Font or emoji icon
@@ -46,16 +57,10 @@ impl Icon {
 	/// Get the size of the icon in pixels.
 	///
 	/// The icon size is determined by the width of a cell in the terminal
-	/// multiplied by a scaling factor.
+	/// multiplied by a scaling factor. Since neither changes during a run,
+	/// the size is only computed once.
 	pub fn size() -> u8 {
-		let scale = std::env::var("PLS_ICON_SCALE")
-			.ok()
-			.and_then(|string| string.parse().ok())
-			.unwrap_or(1.0f32)
-			.min(2.0); // We only allocate two cells for an icon.
-
-		return (scale * PLS.window.as_ref().unwrap().cell_width() as f32) // Convert to px.s
-			.round() as u8;
+		*ICON_SIZE
 	}
 
 	/// Get the output of the icon using the appropriate method:
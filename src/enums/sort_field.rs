@@ -3,7 +3,7 @@ use crate::models::{Node, OwnerMan};
 use crate::traits::{Detail, Name};
 use clap::ValueEnum;
 use serde::{Deserialize, Serialize};
-use std::cmp::Ordering;
+use std::cmp::{Ordering, Reverse};
 use std::collections::HashSet;
 use std::fmt::{Display, Formatter, Result as FmtResult};
 #[cfg(unix)]
@@ -140,6 +140,30 @@ impl SortField {
 		cleaned
 	}
 
+	/// Sort the given nodes in place, using this sort field.
+	///
+	/// Fields whose values are costly to derive, because they allocate a new
+	/// string or look up the owner, are computed once per node and cached for
+	/// the duration of the sort. All other fields are cheap enough to compare
+	/// directly using [`SortField::compare`].
+	///
+	/// Like [`slice::sort_by`], the sort is stable, so nodes that are equal
+	/// for this field retain their order from any previous sort.
+	pub fn sort(&self, nodes: &mut [Node], owner_man: &mut OwnerMan) {
+		let (basis, is_reverse) = self.simplify();
+		match basis {
+			SortField::Cname => Self::sort_by_key(nodes, is_reverse, |node| node.cname()),
+			SortField::Ext => Self::sort_by_key(nodes, is_reverse, |node| node.ext()),
+			SortField::User => {
+				Self::sort_by_key(nodes, is_reverse, |node| node.user_val(owner_man))
+			}
+			SortField::Group => {
+				Self::sort_by_key(nodes, is_reverse, |node| node.group_val(owner_man))
+			}
+			_ => nodes.sort_by(|a, b| self.compare(a, b, owner_man)),
+		}
+	}
+
 	/// Compare the two given nodes, using this sort field.
 	///
 	/// This function handles reverse sort fields, the fields suffixed with '_',
@@ -175,11 +199,37 @@ impl SortField {
 	/// * the basis for the field, the natural order field corresponding to this
 	/// * whether the field is reversed from the natural order
 	fn simplify(&self) -> (Self, bool) {
-		let name = self.to_string();
-		if name.ends_with('_') {
-			(name.trim_end_matches('_').into(), true)
+		match self {
+			SortField::Inode_ => (SortField::Ino, true),
+			SortField::Nlinks_ => (SortField::Nlink, true),
+			SortField::Typ_ => (SortField::Typ, true),
+			SortField::Cat_ => (SortField::Cat, true),
+			SortField::User_ => (SortField::User, true),
+			SortField::Uid_ => (SortField::Uid, true),
+			SortField::Group_ => (SortField::Group, true),
+			SortField::Gid_ => (SortField::Gid, true),
+			SortField::Size_ => (SortField::Size, true),
+			SortField::Blocks_ => (SortField::Blocks, true),
+			SortField::Btime_ => (SortField::Btime, true),
+			SortField::Ctime_ => (SortField::Ctime, true),
+			SortField::Mtime_ => (SortField::Mtime, true),
+			SortField::Atime_ => (SortField::Atime, true),
+			SortField::Name_ => (SortField::Name, true),
+			SortField::Cname_ => (SortField::Cname, true),
+			SortField::Ext_ => (SortField::Ext, true),
+			_ => (*self, false),
+		}
+	}
+
+	/// Stably sort the given nodes by the key computed for each node.
+	///
+	/// The key is computed exactly once per node, instead of twice for every
+	/// comparison. For reversed fields, the key is wrapped in [`Reverse`].
+	fn sort_by_key<K: Ord>(nodes: &mut [Node], is_reverse: bool, mut key: impl FnMut(&Node) -> K) {
+		if is_reverse {
+			nodes.sort_by_cached_key(|node| Reverse(key(node)));
 		} else {
-			(*self, false)
+			nodes.sort_by_cached_key(key);
 		}
 	}
 
@@ -233,7 +283,7 @@ impl SortField {
 			SortField::Ctime => DetailField::Ctime,
 			SortField::Mtime => DetailField::Mtime,
 			SortField::Atime => DetailField::Atime,
-			_ => unreachable!("src/enums/sort_fields.rs / impl SortField / cmp_time"),
+			_ => return None,
 		};
 		let a = a.time_val(field);
 		let b = b.time_val(field);
@@ -247,6 +297,8 @@ impl SortField {
 #[cfg(test)]
 mod tests {
 	use super::SortField;
+	use crate::models::{Node, OwnerMan};
+	use std::path::Path;
 
 	macro_rules! make_clean_test {
 		( $($name:ident: $input:expr => $expected:expr,)* ) => {
@@ -259,6 +311,49 @@ mod tests {
 		};
 	}
 
+	macro_rules! make_simplify_test {
+		( $($name:ident: $input:expr => $expected:expr,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					assert_eq!($input.simplify(), $expected);
+				}
+			)*
+		};
+	}
+
+	make_simplify_test!(
+		test_simplify_natural: SortField::Mtime => (SortField::Mtime, false),
+		test_simplify_reverse: SortField::Cname_ => (SortField::Cname, true),
+		test_simplify_inode: SortField::Inode_ => (SortField::Ino, true),
+		test_simplify_nlinks: SortField::Nlinks_ => (SortField::Nlink, true),
+	);
+
+	macro_rules! make_sort_test {
+		( $($name:ident: $field:expr, $paths:expr => $expected:expr,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					let mut nodes: Vec<_> = $paths
+						.iter()
+						.map(|path| Node::new(Path::new(path)))
+						.collect();
+					$field.sort(&mut nodes, &mut OwnerMan::default());
+					let names: Vec<_> = nodes.iter().map(|node| node.name.as_str()).collect();
+					assert_eq!(names, $expected);
+				}
+			)*
+		};
+	}
+
+	make_sort_test!(
+		test_sort_by_name: SortField::Name, ["b", "C", "a"] => ["C", "a", "b"],
+		test_sort_by_cname: SortField::Cname, ["b", "C", ".a"] => [".a", "b", "C"],
+		test_sort_by_cname_reverse: SortField::Cname_, ["b", "C", ".a"] => ["C", "b", ".a"],
+		test_sort_by_ext_is_stable: SortField::Ext, ["b.rs", "a.md", "c.rs", "d.md"] => ["a.md", "d.md", "b.rs", "c.rs"],
+		test_sort_by_ext_reverse_is_stable: SortField::Ext_, ["b.rs", "a.md", "c.rs", "d.md"] => ["b.rs", "c.rs", "a.md", "d.md"],
+	);
+
 	make_clean_test!(
 		test_none_clears: &[SortField::Mtime, SortField::None, SortField::Gid] => vec![
 			SortField::Gid,
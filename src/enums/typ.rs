@@ -6,15 +6,16 @@ use std::fs::FileType;
 #[cfg(unix)]
 use std::os::unix::fs::FileTypeExt;
 use std::path::Path;
-use std::sync::LazyLock;
 
-static ALL_TYP: LazyLock<Vec<Typ>> = LazyLock::new(|| {
-	Typ::value_variants()
-		.iter()
-		.copied()
-		.filter(|variant| variant != &Typ::All && variant != &Typ::None)
-		.collect()
-});
+const ALL_TYP: [Typ; 7] = [
+	Typ::Dir,
+	Typ::Symlink,
+	Typ::Fifo,
+	Typ::Socket,
+	Typ::BlockDevice,
+	Typ::CharDevice,
+	Typ::File,
+];
 
 /// This enum contains different types of nodes that can be found on UNIX-like
 /// operating systems.
@@ -47,15 +48,19 @@ pub enum Typ {
 }
 
 impl From<FileType> for Typ {
+	/// Map the file type to a `Typ` variant.
+	///
+	/// The types are mutually exclusive, so the checks are ordered by how often
+	/// each type is encountered, letting the common cases return early.
 	fn from(value: FileType) -> Self {
 		match value {
+			_ if value.is_file() => Typ::File,
 			_ if value.is_dir() => Typ::Dir,
 			_ if value.is_symlink() => Typ::Symlink,
 			_ if value.is_fifo() => Typ::Fifo,
 			_ if value.is_socket() => Typ::Socket,
 			_ if value.is_block_device() => Typ::BlockDevice,
 			_ if value.is_char_device() => Typ::CharDevice,
-			_ if value.is_file() => Typ::File,
 			_ => Typ::Unknown,
 		}
 	}
@@ -168,6 +173,7 @@ impl Typ {
 mod tests {
 	use super::Typ;
 	use crate::config::EntryConst;
+	use std::path::Path;
 
 	macro_rules! make_clean_test {
 		( $($name:ident: $input:expr => $expected:expr,)* ) => {
@@ -200,6 +206,24 @@ mod tests {
 		],
 	);
 
+	macro_rules! make_try_from_path_test {
+		( $($name:ident: $path:expr => $expected:expr,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					assert_eq!(Typ::try_from(Path::new($path)).ok(), $expected);
+				}
+			)*
+		};
+	}
+
+	make_try_from_path_test!(
+		test_try_from_file: "Cargo.toml" => Some(Typ::File),
+		test_try_from_dir: "src" => Some(Typ::Dir),
+		test_try_from_char_device: "/dev/null" => Some(Typ::CharDevice),
+		test_try_from_missing: "missing.md" => None,
+	);
+
 	macro_rules! make_name_components_test {
         ( $($name:ident: $typ:expr => $icon:expr, $suffix:expr,)* ) => {
             $(
@@ -10,6 +10,7 @@ mod output;
 mod traits;
 mod utils;
 
+use crate::config::{Args, ConfMan};
 use crate::gfx::is_supported;
 use crate::models::Pls;
 use crate::models::Window;
@@ -18,15 +19,20 @@ use log::debug;
 use std::sync::LazyLock;
 
 static PLS: LazyLock<Pls> = LazyLock::new(|| {
+	// Parse the arguments before anything else so that `--help`, `--version`
+	// and invalid arguments exit before the base configuration is prepared.
+	let args = Args::from_cli();
+
 	let (supports_gfx, window) = match (is_supported(), Window::try_new()) {
 		(true, Some(window)) => (true, Some(window)),
 		_ => (false, None),
 	};
 
 	Pls {
+		conf_man: ConfMan::default(),
+		args,
 		supports_gfx,
 		window,
-		..Pls::default()
 	}
 });
 
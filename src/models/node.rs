@@ -3,13 +3,13 @@ use crate::enums::{Appearance, Collapse, DetailField, Icon, Typ};
 use crate::models::{OwnerMan, Spec};
 use crate::traits::{Detail, Imp, Name, Sym};
 use crate::PLS;
-use std::collections::{HashMap, HashSet};
+use std::collections::HashMap;
 use std::fmt::Write;
 use std::fmt::{Display, Formatter, Result as FmtResult};
-use std::fs::Metadata;
+use std::fs::{DirEntry, Metadata};
 use std::io::Result as IoResult;
-use std::iter::once;
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 
 pub struct Node<'pls> {
 	/// the name of the node on the file system, determined from the path and
@@ -20,12 +20,19 @@ pub struct Node<'pls> {
 	pub display_name: String,
 
 	pub path: PathBuf,
-	meta: IoResult<Metadata>,
-	pub typ: Typ, // `Typ::Unknown` if `meta` is `Err`
+	/// the metadata of the node, fetched lazily so that nodes which are
+	/// filtered out or hidden never make the `lstat(2)` call
+	meta: OnceLock<IoResult<Metadata>>,
+	pub typ: Typ, // `Typ::Unknown` if the type could not be determined
 
-	pub appearances: HashSet<Appearance>,
+	/// the ways in which the node appears, of which there are only a handful
+	/// so a vector is cheaper to create and search than a set
+	pub appearances: Vec<Appearance>,
 
 	pub specs: Vec<&'pls Spec>,
+	/// the importance set by the most specific matching spec, if any, cached
+	/// when matching specs as it is needed multiple times per node
+	pub spec_imp: Option<i8>,
 
 	pub collapse_name: Option<String>,
 	pub children: Vec<Node<'pls>>,
@@ -46,7 +53,10 @@ impl<'pls> Node<'pls> {
 
 		let path = path.to_owned();
 		let meta = path.symlink_metadata();
-		let typ = path.as_path().try_into().unwrap_or(Typ::Unknown);
+		let typ = meta
+			.as_ref()
+			.map_or(Typ::Unknown, |meta| meta.file_type().into());
+		let meta = OnceLock::from(meta);
 
 		Self {
 			name,
@@ -54,8 +64,37 @@ impl<'pls> Node<'pls> {
 			path,
 			meta,
 			typ,
-			appearances: HashSet::new(),
+			appearances: vec![],
 			specs: vec![],
+			spec_imp: None,
+			collapse_name: None,
+			children: vec![],
+		}
+	}
+
+	/// Create a `Node` from an entry yielded while reading a directory.
+	///
+	/// Unlike [`new`](Node::new), this reuses the file type that was read
+	/// along with the directory listing and does not fetch the metadata. Once
+	/// the node is known to be rendered, the metadata should be fetched from
+	/// the same entry using [`fetch_meta`](Node::fetch_meta).
+	pub fn from_entry(entry: &DirEntry) -> Self {
+		let name = entry.file_name().to_string_lossy().to_string();
+		let display_name = name.clone();
+
+		let path = entry.path();
+		let meta = OnceLock::new();
+		let typ = entry.file_type().map_or(Typ::Unknown, Typ::from);
+
+		Self {
+			name,
+			display_name,
+			path,
+			meta,
+			typ,
+			appearances: vec![],
+			specs: vec![],
+			spec_imp: None,
 			collapse_name: None,
 			children: vec![],
 		}
@@ -72,7 +111,7 @@ impl<'pls> Node<'pls> {
 	/// different from the name derived from the path.
 	pub fn solo_file(mut self, name: String) -> Self {
 		self.display_name = name;
-		self.appearances.insert(Appearance::SoloFile);
+		self.appearances.push(Appearance::SoloFile);
 		self
 	}
 
@@ -83,7 +122,7 @@ impl<'pls> Node<'pls> {
 	/// different from the name derived from the path.
 	pub fn symlink(mut self, name: String) -> Self {
 		self.display_name = name;
-		self.appearances.insert(Appearance::Symlink);
+		self.appearances.push(Appearance::Symlink);
 		self
 	}
 
@@ -93,14 +132,14 @@ impl<'pls> Node<'pls> {
 	/// the appearance configured with the tree shapes. It is used to make the
 	/// node the child of another node.
 	pub fn tree_child(mut self) -> Self {
-		self.appearances.insert(Appearance::TreeChild);
+		self.appearances.push(Appearance::TreeChild);
 		self
 	}
 
 	/// Get the `Node` instance with children populated.
 	pub fn tree_parent(mut self, children: Vec<Node<'pls>>) -> Self {
 		self.children = children;
-		self.appearances.insert(Appearance::TreeParent);
+		self.appearances.push(Appearance::TreeParent);
 		self
 	}
 
@@ -109,14 +148,29 @@ impl<'pls> Node<'pls> {
 	// =======
 
 	/// Get the metadata of the node if it was successfully retrieved.
+	///
+	/// If the metadata has not been fetched yet, it is fetched from the path.
 	pub fn meta_ok(&self) -> Option<&Metadata> {
-		self.meta.as_ref().ok()
+		self.meta
+			.get_or_init(|| self.path.symlink_metadata())
+			.as_ref()
+			.ok()
 	}
 
 	// =========
 	// Mutations
 	// =========
 
+	/// Fetch the metadata of the node from the directory entry it was created
+	/// from, unless it has already been fetched.
+	///
+	/// This looks up the entry relative to the open directory, which is
+	/// cheaper than looking up the full path as [`meta_ok`](Node::meta_ok)
+	/// would.
+	pub fn fetch_meta(&self, entry: &DirEntry) {
+		self.meta.get_or_init(|| entry.metadata());
+	}
+
 	/// Link the current node with all the specs that apply to it, based on
 	/// whether the spec's `pattern` matches with this node's name.
 	pub fn match_specs(&mut self, all_specs: &'pls [Spec]) {
@@ -124,6 +178,7 @@ impl<'pls> Node<'pls> {
 			.iter()
 			.filter(|spec| spec.pattern.is_match(self.name.as_bytes()))
 			.collect();
+		self.spec_imp = self.specs.iter().rev().find_map(|spec| spec.importance);
 	}
 
 	/// Find the name of the node against which this node will collapse.
@@ -201,14 +256,7 @@ impl<'pls> Node<'pls> {
 			});
 
 		match icon {
-			Some(icon) => {
-				let icon = String::from(icon);
-				if icon.ends_with(".svg") {
-					Icon::Image(icon)
-				} else {
-					Icon::Text(icon)
-				}
-			}
+			Some(icon) => Icon::from(icon.as_str()),
 			None => Icon::Text(String::default()),
 		}
 	}
@@ -236,35 +284,32 @@ impl<'pls> Node<'pls> {
 		tree_shapes: &[&str],
 	) -> String {
 		let text_directives = self.directives(app_const, entry_const);
+		let is_symlink = self.appearances.contains(&Appearance::Symlink);
 
 		let mut parts = String::default();
 
 		// Tree shape
 		if self.appearances.contains(&Appearance::TreeChild) {
 			let offset = " ".repeat(if PLS.args.align { 3 } else { 2 });
-			parts.push_str(&tree_shapes.iter().fold(String::new(), |mut acc, shape| {
-				let _ = write!(acc, "{offset}{shape}"); // `write!`-ing into a `String` can never fail.
-				acc
-			}));
+			for shape in tree_shapes {
+				let _ = write!(parts, "{offset}{shape}"); // `write!`-ing into a `String` can never fail.
+			}
 		}
 
 		// Icon
-		if PLS.args.icon && !self.appearances.contains(&Appearance::Symlink) {
+		if PLS.args.icon && !is_symlink {
 			let icon = self.icon(conf, entry_const);
 			parts.push_str(&icon.render(&text_directives));
 		}
 
 		// Name and suffix
-		parts.push_str(&format!("<{text_directives}>"));
-		if !PLS.args.align
-			|| self.appearances.contains(&Appearance::Symlink)
-			|| self.appearances.contains(&Appearance::SoloFile)
-		{
+		let _ = write!(parts, "<{text_directives}>"); // `write!`-ing into a `String` can never fail.
+		if !PLS.args.align || is_symlink || self.appearances.contains(&Appearance::SoloFile) {
 			parts.push_str(&self.display_name)
 		} else {
 			parts.push_str(&self.aligned_name())
 		}
-		if PLS.args.suffix && !self.appearances.contains(&Appearance::Symlink) {
+		if PLS.args.suffix && !is_symlink {
 			// Symlink should not have suffix because it should show the path reference without modifications
 			parts.push_str(self.typ.suffix(entry_const))
 		};
@@ -340,20 +385,23 @@ impl<'pls> Node<'pls> {
 			.collect()
 	}
 
-	/// Get a vector of mapping of detail fields to their values.
+	/// Push the mapping of detail fields to their values for this node, and
+	/// then recursively for all its children, into the given vector.
 	///
 	/// Each entry in the vector is a row that can be used to render a table.
-	///
+	/// Writing into one shared vector avoids collecting an intermediate
+	/// vector for every node in the tree.
 	#[allow(clippy::too_many_arguments)]
 	pub fn entries(
 		&self,
+		entries: &mut Vec<HashMap<DetailField, String>>,
 		owner_man: &mut OwnerMan,
 		conf: &Conf,
 		app_const: &AppConst,
 		entry_const: &EntryConst,
 		parent_shapes: &[&str],  // list of shapes inherited from the parent
 		own_shape: Option<&str>, // shape to show just before the current node
-	) -> Vec<HashMap<DetailField, String>> {
+	) {
 		// list of parent shapes to pass to the children
 		let mut child_parent_shapes = parent_shapes.to_vec();
 
@@ -373,24 +421,25 @@ impl<'pls> Node<'pls> {
 			all_shapes.push(more_shape);
 		}
 
-		once(self.row(owner_man, conf, app_const, entry_const, &all_shapes))
-			.chain(self.children.iter().enumerate().flat_map(|(idx, child)| {
-				let child_own_shape = if idx == self.children.len() - 1 {
-					&app_const.tree.bend_dash
-				} else {
-					&app_const.tree.tee_dash
-				};
-
-				child.entries(
-					owner_man,
-					conf,
-					app_const,
-					entry_const,
-					&child_parent_shapes,
-					Some(child_own_shape),
-				)
-			}))
-			.collect()
+		entries.push(self.row(owner_man, conf, app_const, entry_const, &all_shapes));
+
+		for (idx, child) in self.children.iter().enumerate() {
+			let child_own_shape = if idx == self.children.len() - 1 {
+				&app_const.tree.bend_dash
+			} else {
+				&app_const.tree.tee_dash
+			};
+
+			child.entries(
+				entries,
+				owner_man,
+				conf,
+				app_const,
+				entry_const,
+				&child_parent_shapes,
+				Some(child_own_shape),
+			);
+		}
 	}
 }
 
@@ -399,3 +448,25 @@ impl Display for Node<'_> {
 		write!(f, "{}", self.name)
 	}
 }
+
+#[cfg(test)]
+mod tests {
+	use super::Node;
+	use std::os::unix::fs::MetadataExt;
+	use std::path::Path;
+
+	#[test]
+	fn test_entry_node_matches_path_node() {
+		for entry in Path::new("src").read_dir().unwrap() {
+			let entry = entry.unwrap();
+			let node = Node::from_entry(&entry);
+			node.fetch_meta(&entry);
+			let expected = Node::new(&entry.path());
+			assert_eq!(node.typ, expected.typ);
+			assert_eq!(
+				node.meta_ok().map(|meta| meta.ino()),
+				expected.meta_ok().map(|meta| meta.ino())
+			);
+		}
+	}
+}
@@ -7,7 +7,6 @@ use crate::models::{OwnerMan, Window};
 ///
 /// This struct also holds various globals that are used across the
 /// application.
-#[derive(Default)]
 pub struct Pls {
 	/// configuration manager for `.pls.yml` files
 	pub conf_man: ConfMan,
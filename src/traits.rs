@@ -3,7 +3,7 @@ mod imp;
 mod name;
 mod sym;
 
-pub use detail::Detail;
+pub use detail::{Detail, LOCAL_OFFSET};
 pub use imp::Imp;
 pub use name::Name;
 pub use sym::Sym;
@@ -6,8 +6,20 @@ use crate::PLS;
 use log::warn;
 #[cfg(unix)]
 use std::os::unix::fs::MetadataExt;
+use std::sync::LazyLock;
 use std::time::SystemTime;
-use time::{format_description, OffsetDateTime, UtcOffset};
+use time::{OffsetDateTime, UtcOffset};
+
+/// the offset of the local timezone from UTC, determined only once because
+/// the lookup is expensive and the offset does not change during a run
+pub static LOCAL_OFFSET: LazyLock<Option<UtcOffset>> =
+	LazyLock::new(|| match UtcOffset::current_local_offset() {
+		Ok(offset) => Some(offset),
+		Err(_) => {
+			warn!("Could not determine UTC offset");
+			None
+		}
+	});
 
 pub trait Detail {
 	fn size_val(&self) -> Option<u64>;
@@ -188,19 +200,13 @@ impl Detail for Node<'_> {
 	///
 	/// This function returns a marked-up string.
 	fn time(&self, field: DetailField, entry_const: &EntryConst) -> Option<String> {
+		let format = entry_const.timestamp_items.get(&field)?;
 		self.time_val(field).map(|time| {
 			let mut dt: OffsetDateTime = time.into();
-			match UtcOffset::current_local_offset() {
-				Ok(offset) => dt = dt.to_offset(offset),
-				Err(_) => {
-					warn!("Could not determine UTC offset")
-				}
+			if let Some(offset) = *LOCAL_OFFSET {
+				dt = dt.to_offset(offset);
 			}
-			let format = format_description::parse_borrowed::<2>(
-				entry_const.timestamp_formats.get(&field).unwrap(),
-			)
-			.unwrap();
-			dt.format(&format).unwrap()
+			dt.format(format).unwrap()
 		})
 	}
 }
@@ -28,16 +28,12 @@ impl Imp for Node<'_> {
 
 	/// Get the relative importance of the node.
 	///
-	/// This iterates through the specs in reverse, finding the first available
-	/// importance or falling back the the [default](Imp::default_imp). Then it
-	/// subtracts the baseline level from the CLI args.
+	/// This uses the importance from the most specific spec that sets one, as
+	/// cached by [`match_specs`](Node::match_specs), or falls back to the
+	/// [default](Imp::default_imp). Then it subtracts the baseline level from
+	/// the CLI args.
 	fn imp_val(&self) -> i8 {
-		self.specs
-			.iter()
-			.rev()
-			.find_map(|spec| spec.importance)
-			.unwrap_or(self.default_imp())
-			- PLS.args.imp
+		self.spec_imp.unwrap_or(self.default_imp()) - PLS.args.imp
 	}
 
 	/// Determine whether the node should be displayed in the list.
@@ -1,5 +1,5 @@
 use crate::models::Node;
-use std::path::PathBuf;
+use std::path::Path;
 
 pub trait Name {
 	fn ext(&self) -> String;
@@ -16,24 +16,24 @@ impl Name for Node<'_> {
 
 	/// Get the extension for a node.
 	///
-	/// Returns a blank string if the node does not have an extension.
+	/// Returns a blank string if the node does not have an extension. Like
+	/// [`Path::extension`], a single leading dot does not start an extension.
 	fn ext(&self) -> String {
-		self.path
-			.extension()
-			.unwrap_or_default()
-			.to_string_lossy()
-			.to_string()
+		match self.name.rsplit_once('.') {
+			Some((stem, ext)) if !stem.is_empty() => ext.to_string(),
+			_ => String::default(),
+		}
 	}
 
 	/// Get the name for the node, without the extension, if any.
 	///
-	/// Returns the full name if the node does not have an extension.
+	/// Returns the full name if the node does not have an extension. Like
+	/// [`Path::file_stem`], a single leading dot does not start an extension.
 	fn stem(&self) -> String {
-		self.path
-			.file_stem()
-			.unwrap_or_default()
-			.to_string_lossy()
-			.to_string()
+		match self.name.rsplit_once('.') {
+			Some((stem, _)) if !stem.is_empty() => stem.to_string(),
+			_ => self.name.clone(),
+		}
 	}
 
 	/// Get the canonical name for the node.
@@ -42,9 +42,8 @@ impl Name for Node<'_> {
 	/// and normalised to lowercase.
 	fn cname(&self) -> String {
 		self.name
-			.to_lowercase()
 			.trim_start_matches(|c: char| !c.is_alphanumeric())
-			.to_string()
+			.to_lowercase()
 	}
 
 	// ===============
@@ -56,21 +55,74 @@ impl Name for Node<'_> {
 	/// If the node name starts with a dot, the dot is dimmed. If not, the name
 	/// is left-padded with a space to line up the alphabetic characters.
 	fn aligned_name(&self) -> String {
-		let path = PathBuf::from(&self.display_name);
+		let path = Path::new(&self.display_name);
 		if let Some(name) = path.file_name() {
 			let name = name.to_string_lossy();
 
 			// 'clear' ensures that the dot and padding spaces are not formatted.
-			let aligned_name = if name.starts_with('.') {
-				format!("<clear dimmed>.</>{}", name.strip_prefix('.').unwrap())
-			} else {
-				format!("<clear> </>{}", name)
+			let aligned_name = match name.strip_prefix('.') {
+				Some(rest) => format!("<clear dimmed>.</>{rest}"),
+				None => format!("<clear> </>{name}"),
 			};
 
-			if let Some(parent) = path.parent() {
-				return parent.join(aligned_name).to_string_lossy().to_string();
-			}
+			// Names in a directory listing have no parent component, so
+			// there is nothing to join them with.
+			return match path.parent() {
+				Some(parent) if !parent.as_os_str().is_empty() => {
+					parent.join(aligned_name).to_string_lossy().to_string()
+				}
+				_ => aligned_name,
+			};
 		}
 		self.display_name.clone()
 	}
 }
+
+#[cfg(test)]
+mod tests {
+	use super::Name;
+	use crate::models::Node;
+	use std::path::Path;
+
+	macro_rules! make_aligned_name_test {
+		( $($name:ident: $display_name:expr => $expected:expr,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					let node = Node::new(Path::new($display_name))
+						.solo_file(String::from($display_name));
+					assert_eq!(node.aligned_name(), $expected);
+				}
+			)*
+		};
+	}
+
+	macro_rules! make_name_parts_test {
+		( $($name:ident: $path:expr => $ext:expr, $stem:expr, $cname:expr,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					let node = Node::new(Path::new($path));
+					assert_eq!(node.ext(), $ext);
+					assert_eq!(node.stem(), $stem);
+					assert_eq!(node.cname(), $cname);
+				}
+			)*
+		};
+	}
+
+	make_name_parts_test!(
+		test_name_parts_without_ext: "Justfile" => "", "Justfile", "justfile",
+		test_name_parts_with_ext: "README.md" => "md", "README", "readme.md",
+		test_name_parts_with_multiple_exts: "a/b.tar.gz" => "gz", "b.tar", "b.tar.gz",
+		test_name_parts_with_leading_dot: ".gitignore" => "", ".gitignore", "gitignore",
+		test_name_parts_with_leading_dot_and_ext: ".pls.yml" => "yml", ".pls", "pls.yml",
+		test_name_parts_with_trailing_dot: "file." => "", "file", "file.",
+	);
+
+	make_aligned_name_test!(
+		test_aligned_name_pads_plain_name: "README.md" => "<clear> </>README.md",
+		test_aligned_name_dims_leading_dot: ".gitignore" => "<clear dimmed>.</>gitignore",
+		test_aligned_name_keeps_parent: "src/.pls.yml" => "src/<clear dimmed>.</>pls.yml",
+	);
+}
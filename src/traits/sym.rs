@@ -32,11 +32,13 @@ impl Sym for Node<'_> {
 			self.path.join(&target_path)
 		};
 
+		// A single `stat(2)` call on the target follows the entire chain of
+		// symlinks. The kernel detects loops while resolving the path and fails
+		// with `ELOOP`, so there is no need to walk the chain and track visited
+		// inodes manually.
 		let target = match abs_target_path.try_exists() {
 			Err(err) => match err.raw_os_error() {
-				// 62: 'Too many levels of symbolic links'
-				// 40: 'Symbolic link loop'
-				Some(62) | Some(40) => SymTarget::Cyclic(target_path),
+				Some(libc::ELOOP) => SymTarget::Cyclic(target_path),
 				_ => SymTarget::Error(Exc::Io(err)),
 			},
 			Ok(true) => SymTarget::Ok(Box::new(
@@ -47,3 +49,35 @@ impl Sym for Node<'_> {
 		Some(target)
 	}
 }
+
+#[cfg(test)]
+mod tests {
+	use super::Sym;
+	use crate::enums::SymTarget;
+	use crate::models::Node;
+	use std::env;
+	use std::fs;
+	use std::os::unix::fs::symlink;
+
+	macro_rules! make_target_test {
+		( $($name:ident: $target:expr => $expected:pat,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					let link = env::temp_dir().join(format!("pls-{}-{}", stringify!($name), std::process::id()));
+					let _ = fs::remove_file(&link);
+					symlink($target.unwrap_or(&link), &link).unwrap();
+					let target = Node::new(&link).target();
+					fs::remove_file(&link).unwrap();
+					assert!(matches!(target, Some($expected)));
+				}
+			)*
+		};
+	}
+
+	make_target_test!(
+		test_target_ok: Some(env::temp_dir().as_path()) => SymTarget::Ok(_),
+		test_target_broken: Some(std::path::Path::new("missing.md")) => SymTarget::Broken(_),
+		test_target_cyclic: None => SymTarget::Cyclic(_),
+	);
+}
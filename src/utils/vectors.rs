@@ -4,22 +4,46 @@
 //!
 //! * [`dedup`]
 
-use std::collections::{HashSet, VecDeque};
+use std::collections::HashSet;
+use std::hash::Hash;
 
 /// Deduplicate a vector, by preserving the last appearance of a value.
 ///
+/// The deduplication happens in place, so the given vector's allocation is
+/// reused for the output.
+///
 /// # Arguments
 ///
 /// * `vec` - the vector to deduplicate
-pub fn dedup<T: std::hash::Hash + Eq + Clone>(vec: Vec<T>) -> Vec<T> {
-	let mut dedup = VecDeque::new();
+pub fn dedup<T: Hash + Eq + Clone>(mut vec: Vec<T>) -> Vec<T> {
+	let mut set = HashSet::with_capacity(vec.len());
+
+	// Reverse so that retaining the first appearance keeps the last one.
+	vec.reverse();
+	vec.retain(|item| set.insert(item.clone()));
+	vec.reverse();
+
+	vec
+}
+
+#[cfg(test)]
+mod tests {
+	use super::dedup;
 
-	let mut set = HashSet::new();
-	for item in vec.into_iter().rev() {
-		if set.insert(item.clone()) {
-			dedup.push_front(item);
-		}
+	macro_rules! make_dedup_test {
+		( $($name:ident: $input:expr => $expected:expr,)* ) => {
+			$(
+				#[test]
+				fn $name() {
+					assert_eq!(dedup($input), $expected);
+				}
+			)*
+		};
 	}
 
-	dedup.into()
+	make_dedup_test!(
+		test_empty: Vec::<u8>::new() => Vec::<u8>::new(),
+		test_no_duplicates: vec![1, 2, 3] => vec![1, 2, 3],
+		test_keeps_last_appearance: vec![1, 2, 1, 3, 2] => vec![1, 3, 2],
+	);
 }